@@ -1,28 +1,45 @@
+import os
 from flask import Flask
 from flask_restful import Api
-from endpoints.products import ProductsResource
-from endpoints.auth import AuthenticationResource
-from endpoints.categories import CategoriesResource
-from endpoints.favorites import FavoritesResource
-from endpoints.users import UserManagementResource
+from utils.lazy_resource import load_resource, lazy_resource
+from utils.database_connection import DatabaseConnection
+
+# Una única conexión por archivo, compartida por todas las solicitudes (patrón Singleton).
+# Así todos los hilos leen las mismas instantáneas y escriben bajo el mismo lock.
+# Cada archivo se carga en su primer acceso, no al importar la aplicación.
+db = DatabaseConnection('db.json')
+favorites_db = DatabaseConnection('favorites.json')
+
+# Tabla de recursos: (ruta de importación, métodos HTTP, rutas, argumentos del constructor).
+# Los recursos se describen por su ruta de importación para poder cargarlos
+# de forma diferida cuando se activa LAZY_RESOURCES=1.
+RESOURCES = [
+    ('endpoints.auth:AuthenticationResource', ['POST'], ['/auth'], {}),
+    ('endpoints.products:ProductsResource', ['GET', 'POST'], ['/products', '/products/<int:product_id>'], {'db': db}),
+    ('endpoints.categories:CategoriesResource', ['GET', 'POST', 'DELETE'], ['/categories', '/categories/<int:category_id>'], {'db': db}),
+    ('endpoints.favorites:FavoritesResource', ['GET', 'POST', 'DELETE'], ['/favorites'], {'db': favorites_db}),
+    ('endpoints.users:UserManagementResource', ['GET', 'POST', 'DELETE'], ['/users', '/categories/<string:username>'], {'db': db}),
+]
+
+
+def register_resources(api, lazy=False):
+    """
+    Registra todos los recursos en la API, inyectando la conexión compartida que necesite cada uno.
+    Con lazy=True cada módulo de endpoints se importa en su primera solicitud,
+    lo que reduce el tiempo de arranque de cada worker.
+    """
+    for import_path, methods, urls, kwargs in RESOURCES:
+        if lazy:
+            resource = lazy_resource(import_path, methods)
+        else:
+            resource = load_resource(import_path)
+        api.add_resource(resource, *urls, resource_class_kwargs=kwargs)
+
 
 app = Flask(__name__)
 api = Api(app)
 
-import json
-with open('db.json', 'r') as file:
-    products = json.load(file)
-
-api.add_resource( AuthenticationResource,'/auth')
-
-api.add_resource(ProductsResource, '/products', '/products/<int:product_id>') 
-
-api.add_resource(CategoriesResource, '/categories', '/categories/<int:category_id>')
-
-api.add_resource(FavoritesResource, '/favorites')
-
-api.add_resource(UserManagementResource, '/users', '/categories/<string:username>')
+register_resources(api, lazy=os.environ.get('LAZY_RESOURCES') == '1')
 
 if __name__ == '__main__':
     app.run(debug=True)
-
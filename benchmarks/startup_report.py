@@ -0,0 +1,193 @@
+"""
+Reporte de arranque de la API.
+
+Ejecuta un proceso hijo con `python -X importtime` que importa `app`, atiende
+una primera solicitud con el cliente de pruebas de Flask y mide el tiempo
+transcurrido, en modo lazy y en modo eager. El reporte muestra los imports más
+costosos, el tiempo desde el import hasta la primera solicitud atendida y la
+relación lazy/eager de la misma ejecución.
+
+Los tiempos dependen de la máquina, por eso solo se informan. La verificación
+de regresiones usa medidas que no dependen de la máquina, tomadas en cada modo
+y comparadas contra `startup_baseline.json`. El reporte falla si crece alguna:
+- los módulos propios del proyecto (app, endpoints.*, utils.*) que carga `import app`;
+- los paquetes de terceros cargados hasta la primera solicitud;
+- la cantidad de módulos nuevos cargados por `import app` y hasta la primera solicitud.
+
+Las cantidades dependen de las versiones instaladas de las dependencias, por lo
+que la línea base se actualiza con --update al cambiarlas.
+
+Uso:
+    python benchmarks/startup_report.py            # reporta y compara con la línea base
+    python benchmarks/startup_report.py --update   # actualiza la línea base
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_baseline.json')
+
+PROJECT_PACKAGES = ('app', 'endpoints', 'utils')
+# Medidas guardadas en la línea base: conjuntos que no deben ganar elementos
+# y cantidades que no deben crecer.
+TRACKED_SETS = ['modules_at_import', 'third_party_modules']
+TRACKED_COUNTS = ['module_count_at_import', 'module_count_at_first_request']
+RUNS = 5
+
+
+def _child():
+    """
+    Proceso hijo: importa la aplicación y atiende la primera solicitud.
+    """
+    sys.path.insert(0, ROOT)
+    # Solo se cuentan los módulos cargados a partir de aquí, para no incluir
+    # los del intérprete ni los de este script.
+    preloaded = set(sys.modules)
+    start = time.perf_counter()
+    from app import app
+    imported = time.perf_counter()
+
+    # Módulos cargados por `import app`, antes de atender cualquier solicitud.
+    loaded_at_import = set(sys.modules) - preloaded
+    project_modules = sorted(
+        name for name in loaded_at_import if name.split('.')[0] in PROJECT_PACKAGES
+    )
+
+    client = app.test_client()
+    response = client.get('/products', headers={'Authorization': 'abcd1234'})
+    served = time.perf_counter()
+
+    loaded_at_first_request = set(sys.modules) - preloaded
+
+    print(json.dumps({
+        'status_code': response.status_code,
+        'import_ms': (imported - start) * 1000,
+        'first_request_ms': (served - start) * 1000,
+        'modules_at_import': project_modules,
+        'third_party_modules': _third_party(loaded_at_first_request),
+        'module_count_at_import': len(loaded_at_import),
+        'module_count_at_first_request': len(loaded_at_first_request),
+    }))
+
+
+def _third_party(modules):
+    """
+    Retorna los paquetes de nivel superior que no son de la biblioteca estándar ni del proyecto.
+    """
+    return sorted({
+        name.split('.')[0] for name in modules
+    } - set(sys.stdlib_module_names) - set(PROJECT_PACKAGES))
+
+
+def _parse_importtime(stderr):
+    """
+    Convierte la salida de `-X importtime` en una lista de (cumulativo_us, módulo).
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), name.strip()))
+    return imports
+
+
+def measure(lazy=True):
+    """
+    Ejecuta el proceso hijo y retorna sus tiempos junto con el detalle de imports.
+    """
+    env = dict(os.environ, LAZY_RESOURCES='1' if lazy else '0')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--child'],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings['imports'] = _parse_importtime(result.stderr)
+    return timings
+
+
+def measure_median(lazy=True):
+    """
+    Retorna la ejecución mediana (por tiempo hasta la primera solicitud) de varias ejecuciones.
+    """
+    runs = [measure(lazy=lazy) for _ in range(RUNS)]
+    runs.sort(key=lambda run: run['first_request_ms'])
+    return runs[len(runs) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reporte de tiempo de arranque de la API')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--update', action='store_true', help='Actualiza la línea base')
+    parser.add_argument('--top', type=int, default=10, help='Cantidad de imports a mostrar')
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return 0
+
+    results = {'lazy': measure_median(lazy=True), 'eager': measure_median(lazy=False)}
+
+    for mode, median in results.items():
+        if median['status_code'] != 200:
+            print(f"Error: first request returned {median['status_code']} in {mode} mode")
+            return 1
+
+        print(f'Startup report ({mode} mode, median of {RUNS} runs)')
+        print(f"  import app:              {median['import_ms']:8.1f} ms")
+        print(f"  import to first request: {median['first_request_ms']:8.1f} ms")
+        print(f"  modules loaded by import app:      {median['module_count_at_import']}")
+        print(f"  modules loaded until first request: {median['module_count_at_first_request']}")
+        print(f"  project modules at import: {', '.join(median['modules_at_import'])}")
+        print(f"  third-party packages: {', '.join(median['third_party_modules'])}")
+        print(f'  top {args.top} imports by cumulative time:')
+        for cumulative, name in sorted(median['imports'], reverse=True)[:args.top]:
+            print(f'    {cumulative / 1000:8.1f} ms  {name}')
+
+    ratio = results['lazy']['first_request_ms'] / results['eager']['first_request_ms']
+    print(f'Lazy/eager time to first request: {ratio:.3f}')
+
+    if args.update:
+        baseline = {
+            mode: {key: median[key] for key in TRACKED_SETS + TRACKED_COUNTS}
+            for mode, median in results.items()
+        }
+        with open(BASELINE_PATH, 'w') as file:
+            json.dump(baseline, file, indent=4)
+            file.write('\n')
+        print(f'Baseline updated: {BASELINE_PATH}')
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print('No baseline recorded, run with --update')
+        return 0
+
+    with open(BASELINE_PATH, 'r') as file:
+        baseline = json.load(file)
+
+    regressions = 0
+    for mode, median in results.items():
+        for key in TRACKED_SETS:
+            extra = sorted(set(median[key]) - set(baseline[mode][key]))
+            if extra:
+                print(f"Regression ({mode} mode): {key} now also includes {', '.join(extra)}")
+                regressions += 1
+
+        for key in TRACKED_COUNTS:
+            if median[key] > baseline[mode][key]:
+                print(f'Regression ({mode} mode): {key} grew from {baseline[mode][key]} to {median[key]}')
+                regressions += 1
+
+    if regressions:
+        return 1
+
+    print('OK: no tracked startup measure grew beyond the baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,5 @@
-from flask import Blueprint, request
-from flask_restful import Resource, Api
+from flask import request
+from flask_restful import Resource
 
 class AuthenticationResource(Resource):
     def post(self):
@@ -1,7 +1,5 @@
-from flask import Flask, request
-from flask_restful import Resource, Api, reqparse
-import json
-from utils.database_connection import DatabaseConnection
+from flask_restful import Resource, reqparse
+from utils.database_connection import DuplicateItemError
 from utils.authenticator import Authenticator
 
 # Clase que gestiona las categorías.
@@ -10,22 +8,34 @@ from utils.authenticator import Authenticator
 class CategoryManager:
     def __init__(self, db_connection):
         self.db = db_connection  # Se inyecta la conexión a la base de datos.
-        self.categories_data = self.db.get_categories()  # Carga las categorías desde la base de datos.
+
+    @property
+    def categories_data(self):
+        # Retorna las categorías de la versión actual de la base de datos (de solo lectura).
+        return self.db.get_categories()
 
     def add_category(self, name):
-        # Verifica si la categoría ya existe.
-        if name in [cat['name'] for cat in self.categories_data]:
+        # La validación y el cálculo del ID se hacen dentro de la escritura,
+        # sobre la versión actual de las categorías, para evitar duplicados concurrentes.
+        def build(categories):
+            # Verifica si la categoría ya existe.
+            if name in [cat['name'] for cat in categories]:
+                raise DuplicateItemError()
+
+            # Crea una nueva categoría.
+            return {
+                'id': len(categories) + 1,
+                'name': name
+            }
+
+        # Agrega la nueva categoría a la base de datos.
+        try:
+            new_category = self.db.create_item('categories', build)
+        except DuplicateItemError:
             return {'message': 'Category already exists'}, 400
 
-        # Crea una nueva categoría.
-        new_category = {
-            'id': len(self.categories_data) + 1,
-            'name': name
-        }
-
-        # Agrega la nueva categoría a la lista y a la base de datos.
-        self.categories_data.append(new_category)
-        self.db.add_category(new_category)
+        if new_category is None:
+            return {'message': 'Database not connected'}, 500
         return {'message': 'Category added successfully'}, 201
 
     def remove_category(self, name):
@@ -36,8 +46,7 @@ class CategoryManager:
         if category_to_remove is None:
             return {'message': 'Category not found'}, 404
 
-        # Elimina la categoría de la lista y de la base de datos.
-        self.categories_data = [cat for cat in self.categories_data if cat["name"] != name]
+        # Elimina la categoría de la base de datos.
         self.db.remove_category(name)
         return {'message': 'Category removed successfully'}, 200
 
@@ -46,9 +55,8 @@ class CategoryManager:
 # Aplica el patrón de diseño **Facade Pattern**,
 # ya que simplifica la interacción con la lógica de negocio a través de CategoryManager.
 class CategoriesResource(Resource):
-    def __init__(self):
-        self.db = DatabaseConnection('db.json')  # Crea una conexión a la base de datos.
-        self.db.connect()  # Conecta a la base de datos.
+    def __init__(self, db):
+        self.db = db  # Se inyecta la conexión compartida a la base de datos.
         self.category_manager = CategoryManager(self.db)  # Crea un gestor de categorías.
         self.parser = reqparse.RequestParser()  # Inicializa el parser para los argumentos de la solicitud.
         self.parser.add_argument('name', type=str, required=True, help='Name of the category')  # Define el argumento 'name'.
@@ -1,16 +1,15 @@
 from flask_restful import Resource, reqparse
 from flask import request
-from utils.database_connection import DatabaseConnection
+from utils.database_connection import DuplicateItemError
 
 def is_valid_token(token):
     return token == 'abcd1234'
 
 
 class FavoritesResource(Resource):
-    def __init__(self):
-        # Aplicación del patrón Singleton para mantener una única conexión con la base de datos
-        self.db = DatabaseConnection('favorites.json')
-        self.db.connect()
+    def __init__(self, db):
+        # Aplicación del patrón Singleton: app.py inyecta una única conexión compartida con la base de datos
+        self.db = db
 
         # Uso del patrón Builder para configurar el parser de argumentos
         self.parser = self._build_parser()
@@ -64,15 +63,22 @@ class FavoritesResource(Resource):
             return auth_error
 
         args = self.parser.parse_args()
-        favorites = self.db.get_favorites()
 
-        # Patrón Command: encapsular lógica para verificar favoritos existentes
-        if self._is_favorite_exist(args['user_id'], args['product_id'], favorites):
+        def build(favorites):
+            # Patrón Command: encapsular lógica para verificar favoritos existentes.
+            # Se evalúa con el lock de escritura sobre la versión actual de los favoritos.
+            if self._is_favorite_exist(args['user_id'], args['product_id'], favorites):
+                raise DuplicateItemError()
+            # Crear el nuevo favorito (Simple Factory para crear favoritos)
+            return self._create_favorite(args['user_id'], args['product_id'])
+
+        try:
+            new_favorite = self.db.create_item('favorites', build)
+        except DuplicateItemError:
             return {'message': 'Product already in favorites'}, 400
 
-        # Crear el nuevo favorito y agregarlo (Simple Factory para crear favoritos)
-        new_favorite = self._create_favorite(args['user_id'], args['product_id'])
-        self.db.add_favorite(new_favorite)
+        if new_favorite is None:
+            return {'message': 'Database not connected'}, 500
 
         return {'message': 'Product added to favorites', 'favorite': new_favorite}, 201
 
@@ -93,7 +99,7 @@ class FavoritesResource(Resource):
         if not favorite_to_remove:
             return {'message': 'Favorite not found'}, 404
 
-        self._remove_favorite(favorite_to_remove, favorites)
+        self._remove_favorite(favorite_to_remove)
 
         return {'message': 'Product removed from favorites'}, 200
 
@@ -124,12 +130,9 @@ class FavoritesResource(Resource):
             None
         )
 
-    def _remove_favorite(self, favorite, favorites):
+    def _remove_favorite(self, favorite):
         """
         Elimina un favorito de la lista.
         Patrón: Command
         """
-        self.db.data['favorites'] = [
-            fav for fav in favorites if fav != favorite
-        ]
-        self.db._save_data()
+        self.db.remove_item('favorites', lambda fav: fav == favorite)
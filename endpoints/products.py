@@ -1,12 +1,12 @@
 from flask_restful import Resource, reqparse
 from flask import request
-from utils.database_connection import DatabaseConnection
 from utils.authenticator import Authenticator
 from utils.filters import CategoryFilter, IDFilter
 
 class ProductsResource(Resource):
-    def __init__(self):
-        self.db = DatabaseConnection('db.json')
+    def __init__(self, db):
+        # La conexión compartida se inyecta desde app.py.
+        self.db = db
         self.filters = {
             'category': CategoryFilter(),
             'id': IDFilter()
@@ -46,13 +46,17 @@ class ProductsResource(Resource):
         parser.add_argument('price', type=float, required=True, help='Price of the product')
         args = parser.parse_args()
 
-        # Crear nuevo producto
-        new_product = {
-            'id': len(self.db.get_products()) + 1,
-            'name': args['name'],
-            'category': args['category'],
-            'price': args['price']
-        }
-
-        self.db.add_product(new_product)
+        # Crear nuevo producto. El ID se calcula con el lock de escritura tomado
+        # para que dos solicitudes concurrentes no obtengan el mismo.
+        def build(products):
+            return {
+                'id': len(products) + 1,
+                'name': args['name'],
+                'category': args['category'],
+                'price': args['price']
+            }
+
+        new_product = self.db.create_item('products', build)
+        if new_product is None:
+            return {'message': 'Database not connected'}, 500
         return new_product, 201
\ No newline at end of file
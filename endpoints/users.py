@@ -1,6 +1,6 @@
 from flask_restful import Resource, reqparse
 from flask import request
-from utils.database_connection import DatabaseConnection
+from utils.database_connection import DuplicateItemError
 
 def is_valid_token(token):
     return token == 'abcd1234'
@@ -11,16 +11,15 @@ class UserManagementResource(Resource):
     Permite listar, agregar y eliminar usuarios autenticados.
     """
 
-    def __init__(self):
+    def __init__(self, db):
         """
-        Inicializa el recurso con una conexión a la base de datos y un analizador de argumentos (reqparse).
+        Inicializa el recurso con la conexión compartida a la base de datos y un analizador de argumentos (reqparse).
 
         Patrones utilizados:
         - **Repository**: Utiliza `DatabaseConnection` para abstraer y centralizar el acceso a los datos.
         - **Factory**: Facilita la creación de usuarios con roles consistentes.
         """
-        self.db = DatabaseConnection('db.json')
-        self.db.connect()
+        self.db = db
         self.parser = reqparse.RequestParser()
         self.parser.add_argument('username', type=str, required=True, help='Username is required')
         self.parser.add_argument('role', type=str, required=False, help='Role is optional')
@@ -72,13 +71,21 @@ class UserManagementResource(Resource):
             'role': args.get('role', 'viewer')  # Rol por defecto: "viewer"
         }
 
-        # Verifica si el usuario ya está autenticado
-        existing_users = self.db.get_items('authenticated_users')
-        if any(user['username'] == new_user['username'] for user in existing_users):
-            return {'message': 'User already authenticated'}, 400
+        def build(existing_users):
+            # Verifica si el usuario ya está autenticado, sobre la versión actual
+            # de los usuarios y con el lock de escritura tomado.
+            if any(user['username'] == new_user['username'] for user in existing_users):
+                raise DuplicateItemError()
+            return new_user
 
         # Agrega el nuevo usuario autenticado
-        self.db.add_item('authenticated_users', new_user)
+        try:
+            created_user = self.db.create_item('authenticated_users', build)
+        except DuplicateItemError:
+            return {'message': 'User already authenticated'}, 400
+
+        if created_user is None:
+            return {'message': 'Database not connected'}, 500
         return {'message': 'User authenticated successfully', 'user': new_user}, 201
 
     def delete(self):
@@ -106,8 +113,6 @@ class UserManagementResource(Resource):
             return {'message': 'User not found'}, 404
 
         # Filtra para eliminar el usuario
-        updated_users = [u for u in existing_users if u['username'] != username_to_remove]
-        self.db.data['authenticated_users'] = updated_users
-        self.db._save_data()
+        self.db.remove_item('authenticated_users', lambda u: u['username'] == username_to_remove)
 
         return {'message': 'User removed successfully'}, 200
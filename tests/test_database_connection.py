@@ -0,0 +1,241 @@
+import copy
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from flask import Flask
+from flask_restful import Api
+from endpoints.categories import CategoriesResource
+from endpoints.users import UserManagementResource
+from utils.database_connection import DatabaseConnection, DuplicateItemError
+
+
+class TestDatabaseConnectionSnapshots(unittest.TestCase):
+    def setUp(self):
+        """Crea un archivo JSON temporal con datos de prueba."""
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            json.dump({
+                'categories': [{'id': 1, 'name': 'men'}, {'id': 2, 'name': 'women'}],
+                'favorites': []
+            }, file)
+        self.db = DatabaseConnection(self.path)
+        self.db.connect()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_connects_on_first_access(self):
+        """Prueba que sin connect() el archivo se carga una sola vez, en el primer acceso."""
+        db = DatabaseConnection(self.path)
+        self.assertIsNone(db._snapshot)
+
+        self.assertEqual([cat['name'] for cat in db.get_categories()], ['men', 'women'])
+        first = db.snapshot()
+        self.assertIs(db.snapshot(), first)
+        self.assertEqual(first.version, 0)
+
+    def test_snapshot_is_not_affected_by_later_writes(self):
+        """Prueba que una instantánea tomada antes de escribir no cambia."""
+        before = self.db.snapshot()
+        self.db.remove_category('men')
+
+        self.assertEqual([cat['name'] for cat in before.data['categories']], ['men', 'women'])
+        self.assertEqual([cat['name'] for cat in self.db.get_categories()], ['women'])
+        self.assertEqual(self.db.snapshot().version, before.version + 1)
+
+    def test_snapshot_copies_are_frozen(self):
+        """Prueba que copy y pickle de una instantánea conservan los datos y siguen siendo de solo lectura."""
+        categories = copy.deepcopy(self.db.get_categories())
+        self.assertEqual(categories, self.db.get_categories())
+        with self.assertRaises(TypeError):
+            categories[0]['name'] = 'kids'
+
+        categories = pickle.loads(pickle.dumps(self.db.get_categories()))
+        self.assertEqual(categories, self.db.get_categories())
+        with self.assertRaises(TypeError):
+            categories.append({'id': 3, 'name': 'kids'})
+
+    def test_writes_share_unchanged_collections(self):
+        """Prueba que la copia en escritura reutiliza las colecciones y registros no modificados."""
+        before = self.db.snapshot()
+        self.db.add_favorite({'user_id': 1, 'product_id': 2})
+        after = self.db.snapshot()
+
+        self.assertIs(after.data['categories'], before.data['categories'])
+        self.assertEqual(after.data['favorites'], [{'user_id': 1, 'product_id': 2}])
+
+    def test_snapshot_is_read_only(self):
+        """Prueba que los datos de una instantánea no se pueden modificar en el lugar."""
+        with self.assertRaises(TypeError):
+            self.db.data['categories'] = []
+        with self.assertRaises(TypeError):
+            self.db.get_categories()[0]['name'] = 'kids'
+        with self.assertRaises(TypeError):
+            self.db.get_categories().append({'id': 3, 'name': 'kids'})
+
+        record = self.db.get_categories()[0]
+        with self.assertRaises(TypeError):
+            record |= {'name': 'kids'}
+        with self.assertRaises(TypeError):
+            record.__init__({'name': 'kids'})
+        with self.assertRaises(TypeError):
+            self.db.get_categories().__init__([])
+        self.assertEqual(list(self.db.get_categories()), [{'id': 1, 'name': 'men'}, {'id': 2, 'name': 'women'}])
+
+    def test_writes_are_persisted(self):
+        """Prueba que cada nueva versión se guarda en el archivo JSON."""
+        self.db.add_item('favorites', {'user_id': 1, 'product_id': 3})
+
+        with open(self.path, 'r') as file:
+            saved = json.load(file)
+        self.assertEqual(saved['favorites'], [{'user_id': 1, 'product_id': 3}])
+
+    def test_concurrent_writers_do_not_lose_updates(self):
+        """Prueba que las escrituras concurrentes se aplican todas y que los lectores ven instantáneas estables."""
+        errors = []
+        writers_done = threading.Event()
+
+        def writer(user_id):
+            for product_id in range(20):
+                self.db.add_favorite({'user_id': user_id, 'product_id': product_id})
+
+        def reader():
+            try:
+                while not writers_done.is_set():
+                    snapshot = self.db.snapshot()
+                    favorites = snapshot.data['favorites']
+                    length, version = len(favorites), snapshot.version
+
+                    # Cada versión agrega exactamente un favorito a partir de la versión 0.
+                    self.assertEqual(length, version)
+
+                    # Recorre la instantánea mientras los escritores publican nuevas versiones.
+                    seen = 0
+                    for _ in favorites:
+                        seen += 1
+                        time.sleep(0)
+                    self.assertEqual(seen, length)
+                    self.assertEqual(len(favorites), length)
+                    self.assertEqual(snapshot.version, version)
+            except Exception as e:
+                errors.append(e)
+
+        writers = [threading.Thread(target=writer, args=(user_id,)) for user_id in range(4)]
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        writers_done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.db.get_favorites()), 80)
+        self.assertEqual(self.db.snapshot().version, 80)
+
+    def test_create_item_builds_from_current_version(self):
+        """Prueba que create_item valida y calcula IDs bajo el lock, sin duplicados concurrentes."""
+        def build(categories):
+            if 'kids' in [cat['name'] for cat in categories]:
+                raise DuplicateItemError()
+            return {'id': len(categories) + 1, 'name': 'kids'}
+
+        results = []
+
+        def create():
+            try:
+                results.append(self.db.create_item('categories', build))
+            except DuplicateItemError:
+                results.append(None)
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([r for r in results if r is not None], [{'id': 3, 'name': 'kids'}])
+        self.assertEqual([cat['name'] for cat in self.db.get_categories()], ['men', 'women', 'kids'])
+
+    def test_save_does_not_leave_temporary_files(self):
+        """Prueba que el guardado atómico reemplaza el archivo sin dejar temporales."""
+        directory = os.path.dirname(self.path)
+        before = set(os.listdir(directory))
+        self.db.add_item('favorites', {'user_id': 1, 'product_id': 1})
+
+        self.assertEqual(set(os.listdir(directory)), before)
+
+
+class TestSharedConnectionRequests(unittest.TestCase):
+    def setUp(self):
+        """Registra los recursos sobre una única conexión compartida, como en app.py."""
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            json.dump({'categories': [], 'authenticated_users': []}, file)
+        self.db = DatabaseConnection(self.path)
+        self.db.connect()
+
+        self.app = Flask(__name__)
+        api = Api(self.app)
+        api.add_resource(UserManagementResource, '/users', resource_class_kwargs={'db': self.db})
+        api.add_resource(CategoriesResource, '/categories', resource_class_kwargs={'db': self.db})
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _run(self, targets):
+        threads = [threading.Thread(target=target) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_get_and_post_users(self):
+        """Prueba GET y POST concurrentes de usuarios: sin errores 500 ni actualizaciones perdidas."""
+        statuses = []
+        lengths = []
+
+        def writer(writer_id):
+            client = self.app.test_client()
+            for i in range(30):
+                response = client.post('/users', headers={'Authorization': 'abcd1234'},
+                                       json={'username': f'user-{writer_id}-{i}'})
+                statuses.append(response.status_code)
+
+        def reader():
+            client = self.app.test_client()
+            for _ in range(30):
+                response = client.get('/users', headers={'Authorization': 'abcd1234'})
+                statuses.append(response.status_code)
+                lengths.append(len(response.json))
+
+        self._run([lambda i=i: writer(i) for i in range(4)] + [reader] * 4)
+
+        self.assertEqual(set(statuses), {200, 201})
+        self.assertTrue(all(0 <= length <= 120 for length in lengths))
+        self.assertEqual(len(self.db.get_items('authenticated_users')), 120)
+        with open(self.path, 'r') as file:
+            self.assertEqual(len(json.load(file)['authenticated_users']), 120)
+
+    def test_concurrent_duplicate_category_is_added_once(self):
+        """Prueba que POST concurrentes de la misma categoría solo la agregan una vez."""
+        statuses = []
+
+        def post():
+            client = self.app.test_client()
+            response = client.post('/categories', headers={'Authorization': 'abcd1234'}, json={'name': 'kids'})
+            statuses.append(response.status_code)
+
+        self._run([post] * 8)
+
+        self.assertEqual(sorted(statuses), [201] + [400] * 7)
+        self.assertEqual(list(self.db.get_categories()), [{'id': 1, 'name': 'kids'}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import unittest
+from utils.lazy_resource import load_resource, lazy_resource
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Script ejecutado en un proceso aparte para partir de un sys.modules limpio.
+LAZY_STARTUP_SCRIPT = """
+import sys
+from app import app
+
+assert 'endpoints.products' not in sys.modules, 'products imported at startup'
+assert 'endpoints.auth' not in sys.modules, 'auth imported at startup'
+
+import app as app_module
+assert not app_module.db._connected, 'db.json loaded at startup'
+assert not app_module.favorites_db._connected, 'favorites.json loaded at startup'
+
+client = app.test_client()
+response = client.post('/auth', json={'username': 'student', 'password': 'desingp'})
+assert response.status_code == 200, response.status_code
+
+assert 'endpoints.auth' in sys.modules, 'auth not imported on first request'
+assert 'endpoints.products' not in sys.modules, 'products imported by another resource'
+"""
+
+
+class TestLazyStartup(unittest.TestCase):
+    def test_lazy_mode_defers_endpoint_imports(self):
+        """Prueba que en modo lazy los endpoints se importan en su primera solicitud."""
+        env = dict(os.environ, LAZY_RESOURCES='1')
+        result = subprocess.run(
+            [sys.executable, '-c', LAZY_STARTUP_SCRIPT],
+            cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn('Error', result.stdout)
+
+    def test_lazy_resource_declares_same_methods(self):
+        """Prueba que los métodos declarados en app.RESOURCES coinciden con los recursos reales."""
+        from app import RESOURCES
+
+        for import_path, methods, _, _ in RESOURCES:
+            with self.subTest(resource=import_path):
+                proxy = lazy_resource(import_path, methods)
+                real = load_resource(import_path)
+                self.assertEqual(proxy.methods, real.methods)
+                self.assertEqual(proxy.__name__, real.__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,8 +24,11 @@ class TestUserManagementResource(unittest.TestCase):
         # Mock para DatabaseConnection
         self.mock_db = MagicMock()
         self.mock_db.get_items.return_value = []
-        self.mock_db.add_item = MagicMock()
-        self.mock_db._save_data = MagicMock()
+        # create_item evalúa el `build` sobre los usuarios que retorna get_items
+        self.mock_db.create_item.side_effect = (
+            lambda key, build: build(self.mock_db.get_items.return_value)
+        )
+        self.mock_db.remove_item = MagicMock()
 
         # Registrar el recurso usando la subclase con mock
         self.api.add_resource(
@@ -62,9 +65,8 @@ class TestUserManagementResource(unittest.TestCase):
             'message': 'User authenticated successfully',
             'user': {'username': "charlie", "role": "editor"}
         })
-        self.mock_db.add_item.assert_called_with(
-            "authenticated_users", {"username": "charlie", "role": "editor"}
-        )
+        self.mock_db.create_item.assert_called_once()
+        self.assertEqual(self.mock_db.create_item.call_args[0][0], "authenticated_users")
 
     def test_post_duplicate_user(self):
         """Prueba el caso donde se intenta agregar un usuario duplicado."""
@@ -87,7 +89,7 @@ class TestUserManagementResource(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json, {'message': 'User removed successfully'})
-        self.mock_db._save_data.assert_called_once()
+        self.mock_db.remove_item.assert_called_once()
 
     def test_delete_user_not_found(self):
         """Prueba el caso donde se intenta eliminar un usuario inexistente."""
@@ -1,4 +1,4 @@
-from flask import Flask, request
+from flask import request
 
 # Función que valida el token de acceso.
 # Este método es simple y no se asocia a un patrón de diseño específico.
@@ -1,17 +1,158 @@
 import json
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+# Versión inmutable de la base de datos.
+# Los lectores obtienen una instantánea sin bloqueo y la recorren sin que
+# una escritura concurrente pueda modificarla a medias.
+Snapshot = namedtuple('Snapshot', ['version', 'data'])
+
+
+class DuplicateItemError(Exception):
+    """
+    Se lanza desde un `build` de `create_item` para cancelar la escritura
+    cuando el elemento ya existe en la versión actual.
+    """
+
+
+class FrozenRecord(dict):
+    """
+    Registro de solo lectura dentro de una instantánea.
+    Hereda de dict para que siga siendo serializable a JSON por Flask.
+    """
+    def __init__(self, *args, **kwargs):
+        # Solo se puede inicializar una vez; llamar de nuevo a __init__ modificaría el registro.
+        if getattr(self, '_initialized', False):
+            self._readonly()
+        super().__init__(*args, **kwargs)
+        self._initialized = True
+
+    def __reduce__(self):
+        # copy y pickle reconstruyen el registro con el constructor, no con __setitem__.
+        return (FrozenRecord, (dict(self),))
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('Snapshot records are read-only')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+class FrozenList(list):
+    """
+    Colección de solo lectura dentro de una instantánea.
+    Hereda de list (y no de tuple) porque flask_restful interpreta una tupla
+    retornada por un recurso como (datos, código, cabeceras).
+    """
+    def __init__(self, *args, **kwargs):
+        # Solo se puede inicializar una vez; llamar de nuevo a __init__ reemplazaría los elementos.
+        if getattr(self, '_initialized', False):
+            self._readonly()
+        super().__init__(*args, **kwargs)
+        self._initialized = True
+
+    def __reduce__(self):
+        # copy y pickle reconstruyen la colección con el constructor, no con append/extend.
+        return (FrozenList, (list(self),))
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('Snapshot collections are read-only')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+
+def _freeze(value):
+    """
+    Convierte listas en FrozenList y diccionarios en FrozenRecord.
+    Los valores que ya están congelados se reutilizan tal cual (estructura compartida).
+    """
+    if isinstance(value, (FrozenRecord, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenRecord({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
 
 class DatabaseConnection:
+    """
+    Acceso a la base de datos JSON con instantáneas versionadas (MVCC).
+
+    Las lecturas usan la instantánea actual sin tomar ningún lock. Las escrituras
+    construyen una nueva versión por copia en escritura, reutilizando los registros
+    que no cambian, y la publican con una única asignación atómica.
+
+    Si no se llama a connect() de forma explícita, el archivo se carga en el
+    primer acceso a los datos, de modo que crear la conexión no lee ningún archivo.
+    """
     def __init__(self, json_file_path):
         self.json_file_path = json_file_path
-        self.data = None
+        self._snapshot = None
+        self._connected = False
+        self._connect_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @property
+    def data(self):
+        """
+        Datos de la versión actual, de solo lectura.
+        """
+        snapshot = self.snapshot()
+        return snapshot.data if snapshot else None
+
+    def snapshot(self):
+        """
+        Retorna la instantánea actual (versión y datos) sin bloquear.
+        """
+        if not self._connected:
+            self._connect_once()
+        return self._snapshot
+
+    def _connect_once(self):
+        """
+        Carga el archivo la primera vez que se accede a los datos.
+        Patrón: Lazy Initialization. Solo el primer acceso toma el lock; después
+        la verificación de `_connected` no bloquea a los lectores.
+        """
+        with self._connect_lock:
+            if not self._connected:
+                self.connect()
 
     def connect(self):
         try:
             with open(self.json_file_path, 'r') as json_file:
-                self.data = json.load(json_file)
+                data = json.load(json_file)
         except FileNotFoundError:
-            self.data = None
+            self._snapshot = None
+            self._connected = True
             print("Error: json file not found.")
+            return
+
+        with self._write_lock:
+            version = self._snapshot.version + 1 if self._snapshot else 0
+            frozen = {key: _freeze(value) for key, value in data.items()}
+            self._snapshot = Snapshot(version, MappingProxyType(frozen))
+        # Se marca como conectada después de publicar la instantánea, para que un
+        # lector que no toma el lock nunca vea la conexión sin datos.
+        self._connected = True
+
+    def _commit(self, key, update):
+        """
+        Publica una nueva versión en la que `key` se reemplaza por `update(items)`.
+        Patrón: Copy-on-Write. Solo se copia el diccionario de nivel superior y la
+        colección modificada; el resto de colecciones y registros se comparten.
+        """
+        with self._write_lock:
+            current = self._snapshot
+            data = dict(current.data)
+            data[key] = _freeze(update(current.data.get(key, [])))
+            self._snapshot = Snapshot(current.version + 1, MappingProxyType(data))
+            self._save_data()
 
     def get_products(self):
         if self.data:
@@ -21,11 +162,7 @@ class DatabaseConnection:
 
     def add_product(self, new_product):
         if self.data:
-            products = self.data.get('products', [])
-            products.append(new_product)
-            self.data['products'] = products
-            with open(self.json_file_path, 'w') as json_file:
-                json.dump(self.data, json_file, indent=4)
+            self._commit('products', lambda products: products + [new_product])
         else:
             print("Error: something went wrong adding the product")
 
@@ -37,22 +174,15 @@ class DatabaseConnection:
 
     def add_category(self, new_category):
         if self.data:
-            categories = self.data.get('categories', [])
-            categories.append(new_category)
-            self.data['categories'] = categories
-            with open(self.json_file_path, 'w') as json_file:
-                json.dump(self.data, json_file, indent=4)
+            self._commit('categories', lambda categories: categories + [new_category])
         else:
             print("Error: something went wrond adding category")
 
     def remove_category(self, category_name):
         if self.data:
-            categories = self.data.get('categories', [])
-            categories = [cat for cat in categories if cat["name"] != category_name] 
-            self.data['categories'] = categories
-
-            with open(self.json_file_path, 'w') as json_file:
-                json.dump(self.data, json_file, indent=4)
+            self._commit('categories', lambda categories: [
+                cat for cat in categories if cat["name"] != category_name
+            ])
         else:
             print("Error: something went wrond removing category")
 
@@ -64,11 +194,7 @@ class DatabaseConnection:
 
     def add_favorite(self, new_favorite):
         if self.data:
-            favorites = self.data.get('favorites', [])
-            favorites.append(new_favorite)
-            self.data['favorites'] = favorites
-            with open(self.json_file_path, 'w') as json_file:
-                json.dump(self.data, json_file, indent=4)
+            self._commit('favorites', lambda favorites: favorites + [new_favorite])
         else:
             print("Error: something went wrong adding the favorite product")
 
@@ -87,31 +213,55 @@ class DatabaseConnection:
         Agrega un nuevo elemento bajo una clave específica en el archivo JSON.
         """
         if self.data is not None:
-            items = self.data.get(key, [])
-            items.append(new_item)
-            self.data[key] = items
-            self._save_data()
+            self._commit(key, lambda items: items + [new_item])
         else:
             print("Error: Database not connected.")
 
+    def create_item(self, key, build):
+        """
+        Agrega bajo una clave el elemento que retorna `build(items)`.
+        `build` se evalúa con el lock de escritura tomado y recibe la colección de la
+        versión actual, por lo que las validaciones y el cálculo de IDs que haga no
+        pueden quedar desactualizados por una escritura concurrente.
+        Retorna el elemento agregado; `build` puede lanzar DuplicateItemError para cancelar.
+        """
+        if self.data is None:
+            print("Error: Database not connected.")
+            return None
+
+        created = []
+
+        def update(items):
+            new_item = build(items)
+            created.append(new_item)
+            return items + [new_item]
+
+        self._commit(key, update)
+        return created[0]
+
     def remove_item(self, key, condition):
         """
         Elimina elementos bajo una clave específica que cumplan con una condición.
         """
         if self.data is not None:
-            items = self.data.get(key, [])
-            updated_items = [item for item in items if not condition(item)]
-            self.data[key] = updated_items
-            self._save_data()
+            self._commit(key, lambda items: [item for item in items if not condition(item)])
         else:
             print("Error: Database not connected.")
 
     def _save_data(self):
         """
         Guarda los cambios realizados en la base de datos JSON.
+        Escribe en un archivo temporal del mismo directorio y lo reemplaza con
+        os.replace, de modo que el archivo nunca queda vacío ni escrito a medias.
         """
+        directory = os.path.dirname(os.path.abspath(self.json_file_path))
+        temp_path = None
         try:
-            with open(self.json_file_path, 'w') as json_file:
-                json.dump(self.data, json_file, indent=4)
+            with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as json_file:
+                temp_path = json_file.name
+                json.dump(dict(self.data), json_file, indent=4)
+            os.replace(temp_path, self.json_file_path)
         except Exception as e:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             print(f"Error saving data to JSON file: {e}")
@@ -0,0 +1,43 @@
+import importlib
+from flask_restful import Resource
+
+
+def load_resource(import_path):
+    """
+    Importa y retorna la clase de un recurso a partir de una ruta 'modulo:Clase'.
+    """
+    module_name, class_name = import_path.split(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def lazy_resource(import_path, methods):
+    """
+    Crea un recurso que difiere la importación del módulo real hasta la primera solicitud.
+    Patrón: Proxy (proxy virtual), ya que sustituye al recurso real y solo lo carga cuando se necesita.
+
+    Los métodos HTTP se declaran de forma explícita porque Flask los necesita
+    al registrar la ruta, antes de que la clase real haya sido importada.
+    """
+    class_name = import_path.split(':')[1]
+
+    class LazyResource(Resource):
+        _target = None
+
+        def __new__(cls, *args, **kwargs):
+            # La primera solicitud importa la clase real y le transfiere
+            # los atributos que flask_restful asignó al proxy al registrarlo.
+            if cls._target is None:
+                target = load_resource(import_path)
+                target.endpoint = cls.endpoint
+                target.mediatypes = cls.mediatypes
+                cls._target = target
+
+            # Como la instancia retornada no es de tipo LazyResource, Python no llama
+            # a LazyResource.__init__ y Flask despacha la solicitud al recurso real.
+            return cls._target(*args, **kwargs)
+
+    LazyResource.methods = {method.upper() for method in methods}
+    LazyResource.__name__ = class_name
+    LazyResource.__qualname__ = class_name
+    return LazyResource